@@ -1,26 +1,36 @@
 import logging
 import os
+from requests_cache import CachedSession
 from backend.app import app
-from backend.core.populate_config import SCHOOLS_TO_SCRAPE, INDEX_PATH
+from backend.core.populate_config import SCHOOLS_TO_SCRAPE, INDEX_PATH, AGGREGATOR_CONFIG, SCRAPER_CACHE_CONFIG
 from backend.services.scraper.som_scraper import SOMScraper
 from backend.utils.http_client import HttpClient
 from backend.utils.factory import get_embedding_service, get_database_driver
 from backend.services.scraper.seas_scraper import SEASScraper
 from backend.services.scraper.scraper_service import ScraperService
 from backend.services.nih.nih_reporter_proxy import NIHReporterProxy
+from backend.services.nih.nih_reporter_cache import NIHReporterCache
 from backend.services.nih.nih_reporter_service import NIHReporterService
 from backend.services.aggregator.data_aggregator import DataAggregator
 
 logger = logging.getLogger(__name__)
 
-http_client = HttpClient()
+# GET responses (department and profile pages) are revalidated with ETag/Last-Modified once expired,
+# NIH RePORTER POST requests are not cached by the session
+http_client = HttpClient(session=CachedSession(
+    cache_name=SCRAPER_CACHE_CONFIG["PATH"],
+    backend="sqlite",
+    expire_after=SCRAPER_CACHE_CONFIG["EXPIRE_AFTER_SECONDS"],
+    allowable_methods=("GET",),
+    stale_if_error=True,
+))
 
 scraper_service = ScraperService([
     SOMScraper(http_client),
     SEASScraper(http_client),
 ])
 
-nih_service = NIHReporterService(NIHReporterProxy(http_client))
+nih_service = NIHReporterService(NIHReporterProxy(http_client), NIHReporterCache())
 embedding_service = get_embedding_service(app)
 database_driver = get_database_driver(app)
 
@@ -28,17 +38,21 @@ data_aggregator = DataAggregator(scraper_service, nih_service, embedding_service
 
 if __name__ == '__main__':
     logger.info("Starting populate_db.")
-    all_faculty = []
 
     logger.info("Clearing database.")
     database_driver.clear()
 
     try:
         for school in SCHOOLS_TO_SCRAPE:
-            all_faculty.extend(data_aggregator.aggregate_school_faculty_data(school))
-
-        for faculty in all_faculty:
-            database_driver.add_faculty(faculty)
+            faculty_batch = []
+            for faculty in data_aggregator.aggregate_school_faculty_data(school):
+                faculty_batch.append(faculty)
+                if len(faculty_batch) == AGGREGATOR_CONFIG["STREAM_BATCH_SIZE"]:
+                    database_driver.add_faculty_batch(faculty_batch)
+                    faculty_batch = []
+
+            if faculty_batch:
+                database_driver.add_faculty_batch(faculty_batch)
 
     except Exception as e:
         logger.error(f"Failed to aggregate data: {e}")
@@ -1,5 +1,6 @@
 import os
 import datetime
+from types import MappingProxyType
 
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 
@@ -7,7 +8,7 @@ INDEX_PATH = os.path.join(BASE_DIR, "..", "..", "instance", "index.faiss")
 
 SCHOOLS_TO_SCRAPE = ["SOM", "SEAS"]
 
-SCHOOL_DEPARTMENT_DATA = {
+SCHOOL_DEPARTMENT_DATA = MappingProxyType({
     "SEAS": {
         "base_url": "https://engineering.virginia.edu",
         "departments": {
@@ -64,30 +65,61 @@ SCHOOL_DEPARTMENT_DATA = {
             },
         },
     },
-}
+})
+
+_people_urls = [
+    department["people_url"]
+    for school in SCHOOL_DEPARTMENT_DATA.values()
+    for department in school["departments"].values()
+]
+if len(set(_people_urls)) != len(_people_urls):
+    raise ValueError("SCHOOL_DEPARTMENT_DATA contains departments sharing the same people_url")
 
-DEFAULT_FISCAL_YEARS = list(range(datetime.datetime.now().year - 5, datetime.datetime.now().year + 1))
+_current_year = datetime.datetime.now().year
+DEFAULT_FISCAL_YEARS = tuple(range(_current_year - 5, _current_year + 1))
 
-NIH_REPORTER_PAYLOAD = {
-    "criteria": {
+NIH_REPORTER_PAYLOAD = MappingProxyType({
+    "criteria": MappingProxyType({
         "use_relevance": True,
-        "fiscal_years": [],
+        "fiscal_years": (),
         "include_active_projects": True,
-        "pi_names": [
-            {
-                "first_name": "",
-                "last_name": "",
-            }
-        ],
-        "org_names": [
+        "pi_names": (),
+        "org_names": (
             "UNIVERSITY OF VIRGINIA",
             "University of Virginia"
-        ],
-    },
-}
+        ),
+    }),
+})
 
 OPENAI_CONFIG = {
     "EMBEDDING_MODEL": "text-embedding-ada-002",
-    "MAX_TOKENS": 8192,
+    "MAX_TOKENS": 8191, # maximum input tokens accepted by the embedding model
     "EMBEDDING_DIMENSIONS": 1536,
+    "EMBEDDING_BATCH_SIZE": 96,
+    "MAX_BATCH_TOKENS": 300000,
+}
+
+FAISS_CONFIG = {
+    "IVF_PQ_INDEX": "IVF4096,PQ64",
+    "IVF_PQ_MIN_TRAINING_VECTORS": 50000,
+    "SMALL_IVF_PQ_INDEX": "IVF256,PQ48",
+    "SMALL_IVF_PQ_MIN_TRAINING_VECTORS": 10000,
+    "NPROBE": 16,
+}
+
+NIH_CACHE_CONFIG = {
+    "PATH": os.path.join(BASE_DIR, "..", "..", "instance", "nih_cache.sqlite"),
+    "TTL_SECONDS": 30 * 24 * 60 * 60,
+    "MEMORY_CACHE_SIZE": 256,
+}
+
+SCRAPER_CACHE_CONFIG = {
+    "PATH": os.path.join(BASE_DIR, "..", "..", "instance", "scraper_cache.sqlite"),
+    "EXPIRE_AFTER_SECONDS": 24 * 60 * 60,
+}
+
+AGGREGATOR_CONFIG = {
+    "MAX_CONCURRENT_REQUESTS": 8,
+    "NIH_BATCH_SIZE": 25,
+    "STREAM_BATCH_SIZE": 50,
 }
@@ -1,14 +1,36 @@
 import typing
 import logging
+import collections
+import pandas as pd
 from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+from backend.core.populate_config import AGGREGATOR_CONFIG
 from backend.services.embedding.embedding_service import EmbeddingService
 from backend.services.nih.nih_reporter_service import NIHReporterService
 from backend.services.scraper.scraper_service import ScraperService
-from backend.models.models import *
+from backend.models.models import Faculty, Project
 
 logger = logging.getLogger(__name__)
 
 class DataAggregator:
+    FACULTY_COLUMNS = {
+        "Faculty_Name": "name",
+        "School": "school",
+        "Department": "department",
+        "About_Section": "about",
+        "Email_Address": "email",
+        "Profile_URL": "profile_url",
+    }
+    PROJECT_COLUMNS = {
+        "project_number": "project_number",
+        "abstract_text": "abstract",
+        "terms": "relevant_terms",
+        "start_date": "start_date",
+        "end_date": "end_date",
+        "agency_ic_admin": "agency_ic_admin",
+        "activity_code": "activity_code",
+    }
+
     def __init__(self,
                  scraper_service: ScraperService,
                  nih_service: NIHReporterService,
@@ -17,89 +39,153 @@ class DataAggregator:
         self.nih_service = nih_service
         self.embedding_service = embedding_service
 
-    def aggregate_school_faculty_data(self, school: str) -> typing.List[Faculty]:
+    def aggregate_school_faculty_data(self, school: str) -> typing.Iterator[Faculty]:
         """
         Aggregate faculty data for school from scrapers, NIH RePORTER API, generate embeddings
-        Outputs are DB commit-ready
+        Faculty models are built and yielded in batches so only one batch of models is held in memory, outputs are DB commit-ready
         :param school: school acronym
-        :return: dictionary of department faculty data stored as Faculty model objects
+        :return: iterator over school faculty data stored as Faculty model objects
         """
         school_faculty_df = self.scraper_service.get_school_faculty_data(school)
-        school_faculty = dict()
+        faculty_profiles = dict()
+        faculty_departments = dict()
+        faculty_pi_names = dict()
 
         for dept, dept_faculty_df in school_faculty_df.items():
-            for faculty_profile in dept_faculty_df.itertuples():
-                faculty_identifier = (faculty_profile.Faculty_Name, faculty_profile.School, faculty_profile.Email_Address)
-
-                if faculty_identifier in school_faculty:
-                    school_faculty[faculty_identifier] = self._update_faculty_department(school_faculty[faculty_identifier], faculty_profile.Department)
+            for faculty_profile in self._to_records(dept_faculty_df, self.FACULTY_COLUMNS):
+                faculty_identifier = (faculty_profile["name"], faculty_profile["school"], faculty_profile["email"])
 
+                if faculty_identifier in faculty_profiles:
+                    faculty_departments[faculty_identifier].append(faculty_profile["department"])
                 else:
-                    faculty = self._build_faculty_model(faculty_profile)
-                    faculty.embedding_id = self.embedding_service.generate_and_store_embedding(faculty)
-                    school_faculty[faculty_identifier] = faculty
+                    first_name, _, remaining_names = faculty_profile["name"].partition(" ")
+                    faculty_profiles[faculty_identifier] = faculty_profile
+                    faculty_departments[faculty_identifier] = []
+                    faculty_pi_names[faculty_identifier] = (first_name, remaining_names.rpartition(" ")[2] or first_name)
+
+        faculty_identifiers = list(faculty_profiles)
+        batch_size = AGGREGATOR_CONFIG["STREAM_BATCH_SIZE"]
+        stream_batches = [faculty_identifiers[i:i + batch_size] for i in range(0, len(faculty_identifiers), batch_size)]
+        batch_pi_names = [[faculty_pi_names[identifier] for identifier in batch_identifiers] for batch_identifiers in stream_batches]
+
+        for batch_identifiers, batch_projects in zip(stream_batches, self._stream_projects_by_batch(batch_pi_names)):
+            yield from self._aggregate_faculty_batch(
+                [faculty_profiles[identifier] for identifier in batch_identifiers],
+                [faculty_departments[identifier] for identifier in batch_identifiers],
+                batch_projects,
+            )
+
+    def _aggregate_faculty_batch(self,
+                                 faculty_profiles: typing.List[typing.Dict],
+                                 faculty_departments: typing.List[typing.List[str]],
+                                 faculty_projects: typing.List[pd.DataFrame]) -> typing.List[Faculty]:
+        """
+        Build Faculty models and generate embeddings for a batch of faculty
+        :param faculty_profiles: faculty data keyed by Faculty field names, one per unique faculty member
+        :param faculty_departments: additional departments of each faculty member
+        :param faculty_projects: dataframe of NIH project metadata of each faculty member
+        :return: list of Faculty model objects in the same order as faculty_profiles
+        """
+        # Project models are built per faculty, a Project instance can only belong to one Faculty
+        faculty_batch = [
+            self._build_faculty_model(faculty_profile, projects_df)
+            for faculty_profile, projects_df in zip(faculty_profiles, faculty_projects)
+        ]
+
+        for faculty, departments in zip(faculty_batch, faculty_departments):
+            for department in departments:
+                self._update_faculty_department(faculty, department)
+
+        faculty_to_embed = [faculty for faculty in faculty_batch if self._has_embedding_signal(faculty)]
+        if faculty_to_embed:
+            embeddings = self.embedding_service.generate_embeddings(faculty_to_embed)
+            embedding_ids = self.embedding_service.store_embeddings(embeddings)
+            for faculty, embedding_id in zip(faculty_to_embed, embedding_ids):
+                faculty.embedding_id = embedding_id
+
+        return faculty_batch
+
+    def _stream_projects_by_batch(self, batch_pi_names: typing.List[typing.List[typing.Tuple[str, str]]]) -> typing.Iterator[typing.List[pd.DataFrame]]:
+        """
+        Concurrently retrieve NIH-funded projects for each stream batch, batching multiple PIs per NIH RePORTER API request
+        Requests for upcoming stream batches are submitted ahead, at most MAX_CONCURRENT_REQUESTS requests are in flight
+        or unconsumed, and projects are dropped once every faculty member with that PI name has been built
+        :param batch_pi_names: (first name, last name) tuple of each faculty member, grouped by stream batch
+        :return: iterator over dataframes of project metadata of each faculty member, grouped by stream batch
+        """
+        unique_pi_names = list(dict.fromkeys(pi_name for pi_names in batch_pi_names for pi_name in pi_names))
+        nih_batch_size = AGGREGATOR_CONFIG["NIH_BATCH_SIZE"]
+        pending_pi_name_batches = collections.deque(
+            unique_pi_names[i:i + nih_batch_size] for i in range(0, len(unique_pi_names), nih_batch_size)
+        )
+        pending_pi_name_counts = collections.Counter(pi_name for pi_names in batch_pi_names for pi_name in pi_names)
+        max_requests = AGGREGATOR_CONFIG["MAX_CONCURRENT_REQUESTS"]
 
-        return list(school_faculty.values())
+        projects_by_name = dict()
+        futures = collections.deque()
+        with ThreadPoolExecutor(max_workers=max_requests) as executor:
+            for pi_names in batch_pi_names:
+                while pending_pi_name_batches and len(futures) < max_requests:
+                    futures.append(executor.submit(self._get_projects_batch, pending_pi_name_batches.popleft()))
 
-    def _build_faculty_model(self, faculty_profile: typing.Tuple) -> Faculty:
+                # PI names are requested in order of first appearance, so the oldest requests hold this batch's PIs
+                while futures and any(pi_name not in projects_by_name for pi_name in pi_names):
+                    projects_by_name.update(futures.popleft().result())
+                    if pending_pi_name_batches:
+                        futures.append(executor.submit(self._get_projects_batch, pending_pi_name_batches.popleft()))
+
+                yield [projects_by_name.get(pi_name, pd.DataFrame()) for pi_name in pi_names]
+
+                for pi_name in pi_names:
+                    pending_pi_name_counts[pi_name] -= 1
+                    if pending_pi_name_counts[pi_name] == 0:
+                        projects_by_name.pop(pi_name, None)
+
+    def _get_projects_batch(self, pi_names: typing.List[typing.Tuple[str, str]]) -> typing.Dict[typing.Tuple[str, str], pd.DataFrame]:
+        """
+        Retrieve NIH-funded projects for a batch of PIs
+        :param pi_names: list of (first name, last name) tuples
+        :return: dictionary mapping (first name, last name) tuple to dataframe of PI's project metadata
+        """
+        logger.info(f"Fetching NIH project information for {len(pi_names)} PIs.")
+        return self.nih_service.compile_project_metadata_bulk(pi_names)
+
+    def _build_faculty_model(self, faculty_profile: typing.Dict, projects_df: pd.DataFrame) -> Faculty:
         """
         Build faculty model from faculty profile
-        :param faculty_profile: faculty data
+        :param faculty_profile: faculty data keyed by Faculty field names
+        :param projects_df: dataframe of faculty member's NIH project metadata
         :return: faculty model
         """
-        first_name, last_name = self._extract_names(faculty_profile)
-        logger.info(f"Fetching NIH project information for {first_name} {last_name}.")
-        projects = self._get_projects(first_name, last_name)
+        projects = self._convert_to_project_models(projects_df)
 
         faculty = Faculty(
-            name=faculty_profile.Faculty_Name,
-            school=faculty_profile.School,
-            department=faculty_profile.Department,
-            about=faculty_profile.About_Section,
-            email=faculty_profile.Email_Address,
-            profile_url=faculty_profile.Profile_URL,
+            **faculty_profile,
             projects=projects,
             has_funding=self._has_funding(projects),
             embedding_id=-1,
         )
         return faculty
 
-    def _get_projects(self, pi_first_name: str, pi_last_name: str) -> typing.List[Project]:
+    def _convert_to_project_models(self, projects_df: pd.DataFrame) -> typing.List[Project]:
         """
-        Retrieve NIH-funded projects from NIH RePORTER API and convert to Project model object
-        :param pi_first_name: PI first name
-        :param pi_last_name: PI last name
+        Convert NIH project metadata to Project model objects
+        :param projects_df: dataframe of NIH project metadata
         :return: list of Project model objects
         """
-        projects_df = self.nih_service.compile_project_metadata(pi_first_name, pi_last_name)
-        return [self._convert_to_project_model(project) for project in projects_df.itertuples()]
-
-    @staticmethod
-    def _convert_to_project_model(project: typing.Tuple) -> Project:
-        """
-        Convert namedtuple to Project model object
-        :param project: namedtuple
-        :return: Project model object
-        """
-        return Project(
-            project_number=project.project_number,
-            abstract=project.abstract_text,
-            relevant_terms=project.terms,
-            start_date=project.start_date,
-            end_date=project.end_date,
-            agency_ic_admin=project.agency_ic_admin,
-            activity_code=project.activity_code
-        )
+        return [Project(**project) for project in self._to_records(projects_df, self.PROJECT_COLUMNS)]
 
     @staticmethod
-    def _extract_names(faculty_profile: typing.Tuple) -> typing.Tuple[str, str]:
+    def _to_records(df: pd.DataFrame, columns: typing.Dict[str, str]) -> typing.List[typing.Dict]:
         """
-        Extract faculty names from NamedTuple
-        :param faculty_profile: named tuple w/ faculty information
-        :return: first and last name of faculty member
+        Convert dataframe rows to dictionaries keyed by model field names
+        :param df: dataframe
+        :param columns: mapping of dataframe column names to model field names
+        :return: list of dictionaries, one per row
         """
-        names = faculty_profile.Faculty_Name.split(" ")
-        return names[0], names[-1]
+        if df.empty:
+            return []
+        return df.rename(columns=columns)[list(columns.values())].to_dict("records")
 
     @staticmethod
     def _update_faculty_department(faculty: Faculty, new_department: str) -> Faculty:
@@ -111,6 +197,15 @@ class DataAggregator:
         faculty.department = ",".join(sorted(set(faculty.department.split(",") + [new_department])))
         return faculty
 
+    @staticmethod
+    def _has_embedding_signal(faculty: Faculty) -> bool:
+        """
+        Check if faculty has an about section or projects to embed, faculty without either keep embedding_id -1
+        :param faculty: Faculty object
+        :return: True if faculty has text worth embedding else False
+        """
+        return bool(faculty.about and faculty.about.strip()) or len(faculty.projects) > 0
+
     def _has_funding(self, projects: typing.List[Project]) -> bool:
         """
         Check if any projects have active funding
@@ -43,6 +43,26 @@ class DatabaseDriver:
         db.session.commit()
         logger.info(f"Faculty record created successfully for {faculty.name}.")
 
+    def add_faculty_batch(self, faculty: typing.List["Faculty"]):
+        """
+        Persist multiple Faculty objects and their associated Projects in a single commit.
+        :param faculty: list of Faculty objects.
+        """
+        try:
+            with self._app_context():
+                self._add_faculty_batch(faculty)
+        except Exception as e:
+            logger.error(f"Failed to create faculty records for batch of {len(faculty)} faculty: {e}", exc_info=True)
+            raise
+
+    @staticmethod
+    def _add_faculty_batch(faculty: typing.List["Faculty"]):
+        """Helper function to add a batch of faculty to the database."""
+        logger.info(f"Creating faculty records for {len(faculty)} faculty.")
+        db.session.add_all(faculty)
+        db.session.commit()
+        logger.info(f"Faculty records created successfully for {len(faculty)} faculty.")
+
     def get_faculty_by_embedding_id(self, embedding_id: int) -> "Faculty":
         """
         Retrieve a single Faculty object by corresponding embedding ID.
@@ -2,7 +2,7 @@ import logging
 import typing
 from openai import OpenAI
 from backend.core.populate_config import OPENAI_CONFIG
-from backend.utils.token_utils import count_tokens, chunk_text
+from backend.utils.token_utils import count_tokens, count_tokens_batch, chunk_text
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +25,43 @@ class EmbeddingGenerator:
             else self._generate_chunked_embedding(text)
         )
 
+    def generate_embeddings(self, texts: typing.List[str]) -> typing.List[typing.List[float]]:
+        """
+        Generates embeddings for multiple texts, batching inputs into as few API requests as possible.
+        Texts exceeding the token limit are chunked and embedded individually.
+        :param texts: input texts
+        :return: embeddings in the same order as texts
+        """
+        embeddings = [None] * len(texts)
+        batches = []
+        batch_indices = []
+        batch_tokens = 0
+
+        for i, (text, token_count) in enumerate(zip(texts, count_tokens_batch(texts))):
+            if token_count > OPENAI_CONFIG["MAX_TOKENS"]:
+                embeddings[i] = self._generate_chunked_embedding(text)
+                continue
+
+            if batch_indices and (len(batch_indices) == OPENAI_CONFIG["EMBEDDING_BATCH_SIZE"]
+                                  or batch_tokens + token_count > OPENAI_CONFIG["MAX_BATCH_TOKENS"]):
+                batches.append(batch_indices)
+                batch_indices = []
+                batch_tokens = 0
+
+            batch_indices.append(i)
+            batch_tokens += token_count
+
+        if batch_indices:
+            batches.append(batch_indices)
+
+        logger.info(f"Generating {len(texts)} embeddings in {len(batches)} batched requests.")
+        for batch in batches:
+            batch_embeddings = self._call_batch_embedding_api([texts[i] for i in batch])
+            for i, embedding in zip(batch, batch_embeddings):
+                embeddings[i] = embedding
+
+        return embeddings
+
     def _generate_chunked_embedding(self, text: str) -> typing.List[float]:
         """
         Generates and aggregates embeddings for chunked text.
@@ -59,4 +96,15 @@ class EmbeddingGenerator:
             return response.data[0].embedding
         except Exception as e:
             logging.error(f"Error generating single embedding: {e}")
+            raise
+
+    def _call_batch_embedding_api(self, texts: typing.List[str]) -> typing.List[typing.List[float]]:
+        try:
+            response = self.client.embeddings.create(
+                input=texts,
+                model=OPENAI_CONFIG["EMBEDDING_MODEL"],
+            )
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        except Exception as e:
+            logging.error(f"Error generating batch of {len(texts)} embeddings: {e}")
             raise
\ No newline at end of file
@@ -1,5 +1,7 @@
 import typing
 import logging
+import numpy as np
+from backend.core.populate_config import OPENAI_CONFIG
 from backend.services.embedding.preprocessor import Preprocessor
 from backend.services.embedding.embedding_generator import EmbeddingGenerator
 from backend.services.embedding.embedding_storage import EmbeddingStorage
@@ -34,6 +36,31 @@ class EmbeddingService:
             logging.error(f"Failed to generate and store embedding for faculty {faculty.name}: {e}")
             raise
 
+    def generate_embeddings(self, faculty: typing.List["Faculty"]) -> np.ndarray:
+        """
+        Preprocess and generate embeddings for multiple faculty members using batched API requests
+        :param faculty: Faculty model objects containing faculty data
+        :return: float32 matrix of embeddings, one row per faculty member in the same order as faculty
+        """
+        logging.info(f"Starting batched embedding generation for {len(faculty)} faculty.")
+        try:
+            texts = [Preprocessor.preprocess_faculty_profile(faculty_member) for faculty_member in faculty]
+            embeddings = np.empty((len(texts), OPENAI_CONFIG["EMBEDDING_DIMENSIONS"]), dtype=np.float32)
+            for i, embedding in enumerate(self.embedding_generator.generate_embeddings(texts)):
+                embeddings[i] = embedding
+            return embeddings
+        except Exception as e:
+            logging.error(f"Failed to generate embeddings for faculty batch: {e}")
+            raise
+
+    def store_embeddings(self, embeddings: np.ndarray) -> typing.List[int]:
+        """
+        Store embeddings in FAISS with a single index update
+        :param embeddings: float32 matrix of embeddings
+        :return: Indexes of the stored embeddings in FAISS, in row order
+        """
+        return self.embedding_storage.add_embeddings(embeddings)
+
     def search_similar_embeddings(self,
                                   query: str = None,
                                   top_k: int = None,
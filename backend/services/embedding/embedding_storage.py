@@ -2,7 +2,7 @@ import faiss
 import logging
 import typing
 import numpy as np
-from backend.core.populate_config import OPENAI_CONFIG, INDEX_PATH
+from backend.core.populate_config import OPENAI_CONFIG, FAISS_CONFIG, INDEX_PATH
 
 logger = logging.getLogger(__name__)
 
@@ -15,10 +15,75 @@ class EmbeddingStorage:
         if self.index is None:
             try:
                 self.index = faiss.read_index(INDEX_PATH)
+                self._configure_index(self.index)
                 logger.info("FAISS index loaded successfully.")
             except Exception:
                 logger.warning("No FAISS index found; creating a new one.")
-                self.index = faiss.IndexFlatL2(OPENAI_CONFIG["EMBEDDING_DIMENSIONS"])
+                self.index = self._create_flat_index()
+
+    def _create_index(self, training_vectors: np.ndarray) -> faiss.Index:
+        """
+        Create an index suited to the corpus size, IVF-PQ indexes are trained on the given vectors
+        :param training_vectors: vectors used to train the index
+        :return: FAISS index
+        """
+        if len(training_vectors) >= FAISS_CONFIG["IVF_PQ_MIN_TRAINING_VECTORS"]:
+            description = FAISS_CONFIG["IVF_PQ_INDEX"]
+        elif len(training_vectors) >= FAISS_CONFIG["SMALL_IVF_PQ_MIN_TRAINING_VECTORS"]:
+            description = FAISS_CONFIG["SMALL_IVF_PQ_INDEX"]
+        else:
+            logger.info(f"Too few vectors ({len(training_vectors)}) to train an IVF-PQ index; using a flat index.")
+            return self._create_flat_index()
+
+        logger.info(f"Training {description} FAISS index on {len(training_vectors)} vectors.")
+        index = faiss.index_factory(OPENAI_CONFIG["EMBEDDING_DIMENSIONS"], description, faiss.METRIC_INNER_PRODUCT)
+        index.train(training_vectors)
+        self._configure_index(index)
+        return index
+
+    def _rebuild_index(self, vectors: np.ndarray):
+        """
+        Replace the index with one suited to the stored and new vectors combined, embedding ids are kept
+        Stored vectors are reconstructed from the current index, so they keep its quantization error
+        :param vectors: normalized vectors to add
+        """
+        if self.index.ntotal > 0:
+            logger.info(f"Rebuilding FAISS index with {self.index.ntotal} stored and {len(vectors)} new vectors.")
+            vectors = np.vstack([self.index.reconstruct_n(0, self.index.ntotal), vectors])
+        self.index = self._create_index(vectors)
+        self.index.add(vectors)
+
+    @staticmethod
+    def _should_rebuild_index(current_total: int, new_total: int) -> bool:
+        """Helper function to check if the index is empty or growing past a size that calls for an IVF-PQ index."""
+        return current_total == 0 or any(
+            current_total < FAISS_CONFIG[threshold] <= new_total
+            for threshold in ("SMALL_IVF_PQ_MIN_TRAINING_VECTORS", "IVF_PQ_MIN_TRAINING_VECTORS")
+        )
+
+    @staticmethod
+    def _create_flat_index() -> faiss.Index:
+        """Helper function to create an exhaustive-search index storing vectors as float16."""
+        return faiss.IndexScalarQuantizer(
+            OPENAI_CONFIG["EMBEDDING_DIMENSIONS"],
+            faiss.ScalarQuantizer.QT_fp16,
+            faiss.METRIC_INNER_PRODUCT,
+        )
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        """Helper function to L2-normalize vectors so inner product equals cosine similarity."""
+        vectors = np.array(vectors, dtype=np.float32, order="C")
+        faiss.normalize_L2(vectors)
+        return vectors
+
+    @staticmethod
+    def _configure_index(index: faiss.Index):
+        """Helper function to set IVF search parameters and enable reconstruction by embedding ID."""
+        ivf_index = faiss.try_extract_index_ivf(index)
+        if ivf_index is not None:
+            ivf_index.nprobe = FAISS_CONFIG["NPROBE"]
+            ivf_index.make_direct_map()
 
     def save_index(self):
         """
@@ -40,15 +105,31 @@ class EmbeddingStorage:
         :param embedding: faculty embedding
         :return: index of the added embedding
         """
-        self._load_index()
         logging.info(f"Adding embedding for faculty: {faculty_name}.")
+        return self.add_embeddings(np.asarray([embedding], dtype=np.float32))[0]
+
+    def add_embeddings(self, embeddings: np.ndarray) -> typing.List[int]:
+        """
+        Add multiple embeddings to the FAISS index in a single call
+        :param embeddings: matrix of faculty embeddings, one row per faculty
+        :return: indexes of the added embeddings, in row order
+        """
+        if len(embeddings) == 0:
+            return []
+
+        logging.info(f"Adding {len(embeddings)} embeddings.")
         try:
-            vector = np.array([embedding], dtype=np.float32)
-            self.index.add(vector)
+            vectors = self._normalize(embeddings)
+            self._load_index()
+            start_id = self.index.ntotal
+            if self._should_rebuild_index(start_id, start_id + len(vectors)):
+                self._rebuild_index(vectors)
+            else:
+                self.index.add(vectors)
             self.save_index()
-            return self.index.ntotal - 1
+            return (start_id + np.arange(len(vectors))).tolist()
         except Exception as e:
-            logging.error(f"Error adding embedding: {e}")
+            logging.error(f"Error adding embeddings: {e}")
             raise
 
     def search_similar_embeddings(self,
@@ -74,7 +155,7 @@ class EmbeddingStorage:
         logger.info(f"Performing FAISS search with top_k={top_k}.")
 
         try:
-            query_vector = np.expand_dims(np.array(query_embedding, dtype=np.float32), axis=0)
+            query_vector = self._normalize([query_embedding])
 
             if self.are_search_parameters_empty(school, department, activity_code, agency_ic_admin, has_funding):
                 return self._search_full_index(query_vector, top_k)
@@ -97,7 +178,7 @@ class EmbeddingStorage:
                            query_vector: np.ndarray = None,
                            top_k: int = None) -> typing.List[int]:
         _, indices = self.index.search(query_vector, top_k)
-        return indices.flatten().tolist()
+        return [eid for eid in indices.flatten().tolist() if eid >= 0]
 
     def search_with_parameters(self,
                                query_vector: np.ndarray,
@@ -117,7 +198,7 @@ class EmbeddingStorage:
             agency_ic_admin=agency_ic_admin,
             has_funding=has_funding
         )
-        valid_eids = [eid for eid in filtered_eids if eid < self.index.ntotal]
+        valid_eids = [eid for eid in filtered_eids if 0 <= eid < self.index.ntotal]
 
         if not valid_eids:
             logging.warning("No matching embeddings found after filtering.")
@@ -13,10 +13,10 @@ class Preprocessor:
         """
         logger.info(f"Preprocessing data for faculty: {faculty.name}")
 
-        project_details = " ".join(
+        project_details = " ".join([
             f"Abstract: {project.abstract or ''}, Terms: {project.relevant_terms or ''}\n"
             for project in faculty.projects
-        )
+        ])
 
         processed_text = (
             f"Department: {faculty.department}."
@@ -24,7 +24,7 @@ class Preprocessor:
             f"About: {faculty.about or ''}."
             f"Projects: {project_details}"
         )
-        logging.debug(f"Processed text for faculty {faculty.name}: {processed_text}")
+        logger.debug("Processed text for faculty %s: %s", faculty.name, processed_text)
         return processed_text
 
     @staticmethod
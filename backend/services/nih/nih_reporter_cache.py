@@ -0,0 +1,125 @@
+import os
+import time
+import orjson
+import typing
+import sqlite3
+import logging
+import threading
+import collections
+from contextlib import closing
+from backend.core.populate_config import NIH_CACHE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+class NIHReporterCache:
+    SEARCH_NAMESPACE = "search" # raw response of a single-PI search
+    SPLIT_NAMESPACE = "split" # projects assigned to the PI from a multi-PI search
+
+    def __init__(self,
+                 cache_path: str = NIH_CACHE_CONFIG["PATH"],
+                 ttl_seconds: int = NIH_CACHE_CONFIG["TTL_SECONDS"],
+                 memory_cache_size: int = NIH_CACHE_CONFIG["MEMORY_CACHE_SIZE"]):
+        """
+        Persistent cache of raw NIH RePORTER API responses, backed by SQLite with a bounded in-memory LRU layer
+        :param cache_path: path to the SQLite cache file
+        :param ttl_seconds: seconds after which cached responses expire
+        :param memory_cache_size: maximum number of responses kept in memory
+        """
+        self.cache_path = cache_path
+        self.ttl_seconds = ttl_seconds
+        self.memory_cache_size = memory_cache_size
+        self._memory_cache = collections.OrderedDict() # key -> (response, created_at), least recently used first
+        self._lock = threading.Lock()
+        self._create_table()
+
+    @staticmethod
+    def make_key(pi_first_name: str, pi_last_name: str, fiscal_years: typing.Iterable[int], namespace: str = SEARCH_NAMESPACE) -> typing.Tuple:
+        """
+        Build cache key for PI lookup
+        :param pi_first_name: PI's first name
+        :param pi_last_name: PI's last name
+        :param fiscal_years: fiscal years during which projects were/are active
+        :param namespace: kind of response stored, single-PI and multi-PI lookups store different data
+        :return: cache key
+        """
+        return namespace, pi_first_name.lower(), pi_last_name.lower(), tuple(fiscal_years)
+
+    def get(self, key: typing.Tuple) -> typing.Dict | None:
+        """
+        Retrieve cached API response
+        :param key: cache key
+        :return: API response as a dictionary, None if missing or expired
+        """
+        with self._lock:
+            if key in self._memory_cache:
+                response, created_at = self._memory_cache[key]
+                if not self._is_expired(created_at):
+                    self._memory_cache.move_to_end(key)
+                    return response
+                del self._memory_cache[key]
+
+        try:
+            with self._lock, closing(sqlite3.connect(self.cache_path)) as connection:
+                row = connection.execute(
+                    "SELECT response, created_at FROM nih_cache WHERE key = ?",
+                    (self._serialize_key(key),)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read NIH RePORTER cache entry for key {key}, treating as a miss: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        response, created_at = row
+        if self._is_expired(created_at):
+            logger.info(f"NIH RePORTER cache entry expired for key: {key}")
+            return None
+
+        response = orjson.loads(response)
+        self._remember(key, response, created_at)
+        return response
+
+    def set(self, key: typing.Tuple, response: typing.Dict):
+        """
+        Store API response
+        :param key: cache key
+        :param response: API response as a dictionary
+        """
+        created_at = time.time()
+        self._remember(key, response, created_at)
+        try:
+            with self._lock, closing(sqlite3.connect(self.cache_path)) as connection, connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO nih_cache (key, response, created_at) VALUES (?, ?, ?)",
+                    (self._serialize_key(key), orjson.dumps(response).decode(), created_at)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to persist NIH RePORTER cache entry for key {key}: {e}")
+
+    def _remember(self, key: typing.Tuple, response: typing.Dict, created_at: float):
+        """Helper function to add a response to the in-memory layer, evicting the least recently used entries."""
+        if self.memory_cache_size <= 0:
+            return
+        with self._lock:
+            self._memory_cache[key] = (response, created_at)
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > self.memory_cache_size:
+                self._memory_cache.popitem(last=False)
+
+    def _is_expired(self, created_at: float) -> bool:
+        """Helper function to check if an entry created at the given time has outlived the TTL."""
+        return time.time() - created_at > self.ttl_seconds
+
+    def _create_table(self):
+        """Helper function to create the cache table if missing."""
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        with closing(sqlite3.connect(self.cache_path)) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS nih_cache (key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def _serialize_key(key: typing.Tuple) -> str:
+        """Helper function to serialize cache key for storage."""
+        return orjson.dumps(key).decode()
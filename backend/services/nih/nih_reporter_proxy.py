@@ -1,5 +1,8 @@
+import time
 import typing
 import logging
+import orjson
+import threading
 from requests import RequestException, Timeout, HTTPError
 from backend.utils.http_client import HttpClient
 
@@ -7,10 +10,13 @@ logger = logging.getLogger(__name__)
 
 class NIHReporterProxy:
     NIH_REPORTER_ENDPOINT = "https://api.reporter.nih.gov/v2/projects/search"
+    MIN_REQUEST_INTERVAL_SECONDS = 1.0 # NIH RePORTER asks clients to send no more than one request per second
 
-    def __init__(self, http_client: HttpClient):
+    def __init__(self, http_client: HttpClient, min_request_interval: float = MIN_REQUEST_INTERVAL_SECONDS):
         self.http_client = http_client
-
+        self.min_request_interval = min_request_interval
+        self._rate_limit_lock = threading.Lock()
+        self._next_request_time = 0.0
 
     def call_reporter_api(self, payload: typing.Dict) -> typing.Dict:
         """
@@ -19,10 +25,23 @@ class NIHReporterProxy:
         :return: API response as a dictionary
         :raises: Any exceptions raised by the HTTP client
         """
+        self._wait_for_rate_limit()
         try:
             logger.info(f"Invoking NIH RePORTER API with payload: {payload}")
-            response = self.http_client.post(self.NIH_REPORTER_ENDPOINT, json=payload)
-            return response.json()
+            response = self.http_client.post(
+                self.NIH_REPORTER_ENDPOINT,
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+            )
+            return orjson.loads(response.content)
         except (RequestException, Timeout, HTTPError) as e:
             logger.error(f"NIH Reporter API request failed: {e}")
             raise
+
+    def _wait_for_rate_limit(self):
+        """Helper function to space requests at least min_request_interval apart, shared by all calling threads."""
+        with self._rate_limit_lock:
+            wait_seconds = self._next_request_time - time.monotonic()
+            if wait_seconds > 0:
+                time.sleep(wait_seconds)
+            self._next_request_time = time.monotonic() + self.min_request_interval
@@ -1,19 +1,22 @@
 import typing
 import pandas as pd
 import logging
-import copy
 from datetime import datetime
 from backend.services.nih.nih_reporter_proxy import NIHReporterProxy
+from backend.services.nih.nih_reporter_cache import NIHReporterCache
 from backend.core.populate_config import NIH_REPORTER_PAYLOAD, DEFAULT_FISCAL_YEARS
 
 logger = logging.getLogger(__name__)
 
 class NIHReporterService:
+    PAGE_LIMIT = 500
+    MAX_OFFSET = 14999
 
-    def __init__(self, proxy: NIHReporterProxy):
+    def __init__(self, proxy: NIHReporterProxy, cache: NIHReporterCache = None):
         self.proxy = proxy
+        self.cache = cache
 
-    def compile_project_metadata(self, pi_first_name: str = None, pi_last_name: str = None, fiscal_years: typing.List[int] = DEFAULT_FISCAL_YEARS) -> pd.DataFrame:
+    def compile_project_metadata(self, pi_first_name: str = None, pi_last_name: str = None, fiscal_years: typing.Sequence[int] = DEFAULT_FISCAL_YEARS) -> pd.DataFrame:
         """
         Extract relevant metadata from PI projects for provided fiscal years
         :param pi_first_name: PI's first name
@@ -28,6 +31,33 @@ class NIHReporterService:
             logger.warning(f"No projects founds for PI '{pi_first_name} {pi_last_name}' and fiscal years '{fiscal_years}'")
             return pd.DataFrame()
 
+        return self.compile_projects(projects)
+
+    def compile_project_metadata_bulk(self, pi_names: typing.List[typing.Tuple[str, str]], fiscal_years: typing.Sequence[int] = DEFAULT_FISCAL_YEARS) -> typing.Dict[typing.Tuple[str, str], pd.DataFrame]:
+        """
+        Extract relevant metadata from projects of multiple PIs for provided fiscal years using a single search
+        :param pi_names: list of (first name, last name) tuples
+        :param fiscal_years: fiscal years during which projects were/are active
+        :return: dictionary mapping (first name, last name) tuple to dataframe of PI's project metadata
+        """
+        responses = self.invoke_proxy_bulk(pi_names=pi_names, fiscal_years=fiscal_years)
+
+        pi_projects = dict()
+        for pi_name, response in responses.items():
+            projects = response["results"]
+            if len(projects) == 0:
+                logger.warning(f"No projects founds for PI '{pi_name[0]} {pi_name[1]}' and fiscal years '{fiscal_years}'")
+                pi_projects[pi_name] = pd.DataFrame()
+            else:
+                pi_projects[pi_name] = self.compile_projects(projects)
+        return pi_projects
+
+    def compile_projects(self, projects: typing.List[typing.Dict]) -> pd.DataFrame:
+        """
+        Extract relevant metadata from API response projects
+        :param projects: list of JSON w/ project metadata
+        :return: dataframe of project metadata
+        """
         compiled_metadata = [
             {
                 "project_number": self.get_project_number(project),
@@ -46,8 +76,104 @@ class NIHReporterService:
     def invoke_proxy(self, pi_first_name: str, pi_last_name: str, fiscal_years: typing.List) -> typing.Dict:
         if pi_first_name is None or pi_last_name is None:
             raise ValueError("pi_first_name and pi_last_name cannot be None")
+
+        cache_key = NIHReporterCache.make_key(pi_first_name, pi_last_name, fiscal_years)
+        if self.cache:
+            cached_response = self.cache.get(cache_key)
+            if cached_response is not None:
+                logger.info(f"Using cached NIH RePORTER response for PI '{pi_first_name} {pi_last_name}'")
+                return cached_response
+
         payload = self.build_payload(pi_first_name, pi_last_name, fiscal_years)
-        return self.proxy.call_reporter_api(payload)
+        response = self.proxy.call_reporter_api(payload)
+
+        if self.cache:
+            self.cache.set(cache_key, response)
+        return response
+
+    def invoke_proxy_bulk(self, pi_names: typing.List[typing.Tuple[str, str]], fiscal_years: typing.List) -> typing.Dict[typing.Tuple[str, str], typing.Dict]:
+        """
+        Search projects of multiple PIs in one paginated search and split the results per PI
+        :param pi_names: list of (first name, last name) tuples
+        :param fiscal_years: fiscal years during which projects were/are active
+        :return: dictionary mapping (first name, last name) tuple to API response for that PI
+        """
+        if any(first_name is None or last_name is None for first_name, last_name in pi_names):
+            raise ValueError("pi_first_name and pi_last_name cannot be None")
+
+        responses = dict()
+        uncached_pi_names = []
+        for pi_name in dict.fromkeys(pi_names):
+            cached_response = self.cache.get(NIHReporterCache.make_key(*pi_name, fiscal_years, NIHReporterCache.SPLIT_NAMESPACE)) if self.cache else None
+            if cached_response is not None:
+                responses[pi_name] = cached_response
+            else:
+                uncached_pi_names.append(pi_name)
+
+        if not uncached_pi_names:
+            logger.info(f"Using cached NIH RePORTER responses for {len(responses)} PIs")
+            return responses
+
+        payload = self.build_bulk_payload(uncached_pi_names, fiscal_years)
+        projects = self._call_reporter_api_paginated(payload)
+
+        for pi_name, pi_projects in self.split_projects_by_pi(uncached_pi_names, projects).items():
+            response = {"results": pi_projects}
+            responses[pi_name] = response
+            if self.cache:
+                self.cache.set(NIHReporterCache.make_key(*pi_name, fiscal_years, NIHReporterCache.SPLIT_NAMESPACE), response)
+        return responses
+
+    def _call_reporter_api_paginated(self, payload: typing.Dict) -> typing.List[typing.Dict]:
+        """
+        Call the NIH RePORTER API until all pages of results have been retrieved
+        :param payload: the payload for the POST request
+        :return: projects from all pages
+        """
+        projects = []
+        offset = 0
+        while offset <= self.MAX_OFFSET:
+            payload["offset"] = offset
+            payload["limit"] = self.PAGE_LIMIT
+            response = self.proxy.call_reporter_api(payload)
+
+            results = response["results"]
+            projects.extend(results)
+            offset += len(results)
+
+            if not results or offset >= response.get("meta", {}).get("total", 0):
+                break
+        return projects
+
+    @staticmethod
+    def split_projects_by_pi(pi_names: typing.List[typing.Tuple[str, str]], projects: typing.List[typing.Dict]) -> typing.Dict[typing.Tuple[str, str], typing.List[typing.Dict]]:
+        """
+        Assign projects to the requested PIs listed in their principal investigators
+        Projects without an exact case-insensitive first/last name match are dropped, the per-PI split is cached
+        for the cache TTL so a dropped project stays missing until the entry expires
+        :param pi_names: list of (first name, last name) tuples
+        :param projects: list of JSON w/ project metadata
+        :return: dictionary mapping (first name, last name) tuple to PI's projects
+        """
+        pi_projects = {pi_name: [] for pi_name in pi_names}
+        normalized_pi_names = dict()
+        for first_name, last_name in pi_names:
+            normalized_pi_names.setdefault((first_name.lower(), last_name.lower()), []).append((first_name, last_name))
+
+        unassigned_project_count = 0
+        for project in projects:
+            matched_pi_names = set()
+            for pi in project.get("principal_investigators") or []:
+                normalized_name = ((pi.get("first_name") or "").strip().lower(), (pi.get("last_name") or "").strip().lower())
+                matched_pi_names.update(normalized_pi_names.get(normalized_name, []))
+            if not matched_pi_names:
+                unassigned_project_count += 1
+            for pi_name in matched_pi_names:
+                pi_projects[pi_name].append(project)
+
+        if unassigned_project_count:
+            logger.warning(f"{unassigned_project_count} of {len(projects)} NIH RePORTER projects did not match any requested PI name and were not assigned")
+        return pi_projects
 
     def get_project_number(self, project: typing.Dict) -> str:
         """
@@ -117,7 +243,7 @@ class NIHReporterService:
             return None
 
     @staticmethod
-    def build_payload(pi_first_name: str, pi_last_name: str, fiscal_years: typing.List[int]) -> typing.Dict:
+    def build_payload(pi_first_name: str, pi_last_name: str, fiscal_years: typing.Sequence[int]) -> typing.Dict:
         """
         Build the payload for the NIH RePORTER API request
         :param pi_first_name: PI's first name
@@ -125,11 +251,32 @@ class NIHReporterService:
         :param fiscal_years: list of fiscal years to filter results
         :return: payload as dictionary
         """
-        payload = copy.deepcopy(NIH_REPORTER_PAYLOAD)
-        payload["criteria"]["pi_names"][0]["first_name"] = pi_first_name
-        payload["criteria"]["pi_names"][0]["last_name"] = pi_last_name
-        payload["criteria"]["fiscal_years"] = fiscal_years
-        return payload
+        return {
+            "criteria": {
+                **NIH_REPORTER_PAYLOAD["criteria"],
+                "pi_names": [{"first_name": pi_first_name, "last_name": pi_last_name}],
+                "fiscal_years": list(fiscal_years),
+            },
+        }
+
+    @staticmethod
+    def build_bulk_payload(pi_names: typing.List[typing.Tuple[str, str]], fiscal_years: typing.Sequence[int]) -> typing.Dict:
+        """
+        Build the payload for an NIH RePORTER API request covering multiple PIs
+        :param pi_names: list of (first name, last name) tuples
+        :param fiscal_years: list of fiscal years to filter results
+        :return: payload as dictionary
+        """
+        return {
+            "criteria": {
+                **NIH_REPORTER_PAYLOAD["criteria"],
+                "pi_names": [
+                    {"first_name": first_name, "last_name": last_name}
+                    for first_name, last_name in pi_names
+                ],
+                "fiscal_years": list(fiscal_years),
+            },
+        }
 
     @staticmethod
     def safe_get_field(data: dict, key: str) -> typing.Any:
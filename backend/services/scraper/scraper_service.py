@@ -1,6 +1,7 @@
 import typing
 import logging
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 
 from backend.services.scraper.base_scraper import BaseScraper
 from backend.utils.institution_utils import InstitutionUtils
@@ -8,8 +9,9 @@ from backend.utils.institution_utils import InstitutionUtils
 logger = logging.getLogger(__name__)
 
 class ScraperService:
-    def __init__(self, scrapers: typing.List[BaseScraper]):
+    def __init__(self, scrapers: typing.List[BaseScraper], max_workers: int = 10):
         self.scrapers = scrapers
+        self.max_workers = max_workers
 
     def get_school_faculty_data(self, school: str) -> typing.Dict[str, pd.DataFrame]:
         """
@@ -21,11 +23,9 @@ class ScraperService:
         logger.info(f"Fetching school faculty data for school: {school}")
 
         try:
-            school_data = {}
-            for dept in departments:
-                data = self.get_department_faculty_data(dept)
-                school_data[dept] = data
-            return school_data
+            with ThreadPoolExecutor(max_workers=max(1, min(len(departments), self.max_workers))) as executor:
+                futures = {dept: executor.submit(self.get_department_faculty_data, dept) for dept in departments}
+                return {dept: future.result() for dept, future in futures.items()}
         except Exception as e:
             logger.critical(f"Failed to fetch school faculty data for school: {school}: {e}")
             raise RuntimeError(f"Data generation failed for school: {school}") from e
@@ -1,27 +1,37 @@
+import time
 import requests
 import logging
 import typing
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout, HTTPError
 from backend.utils.institution_utils import InstitutionUtils
 
 logger = logging.getLogger(__name__)
 
 class HttpClient:
-    def __init__(self, timeout: int = 10, retries: int = 3):
+    def __init__(self, timeout: int = 10, retries: int = 3, pool_size: int = 32, session: requests.Session = None, backoff: float = 1.0):
         """
         Initializes the HTTP client facade.
         :param timeout (int): Timeout in seconds for requests.
         :param retries (int): Number of retries for transient errors.
+        :param backoff (float): Seconds to wait before the first retry, doubled for each further retry.
+        :param pool_size (int): Number of keep-alive connections pooled per host.
+        :param session (requests.Session): Session to send requests through, e.g. a caching session.
         """
         self.timeout = timeout
         self.retries = retries
+        self.backoff = backoff
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def request(self, method: str, url: str, **kwargs: typing.Any) -> requests.Response | None:
         """
         Makes an HTTP request with retries.
         :param method: HTTP method (e.g., 'GET', 'POST', 'PUT', 'DELETE').
         :param url: API endpoint (relative or absolute URL).
-        :param kwargs: Additional arguments to pass to `requests.request`, such as `json`, `headers`, or `params`.
+        :param kwargs: Additional arguments to pass to `requests.Session.request`, such as `json`, `headers`, or `params`.
         :return requests.Response: The HTTP response object.
         :raise HTTPError: For non-2xx HTTP responses.
         :raise Timeout: If the request times out.
@@ -33,13 +43,14 @@ class HttpClient:
         for attempt in range(self.retries):
             try:
                 logger.info(f"Making {method} request to {url} (attempt {attempt + 1}/{self.retries})")
-                response = requests.request(method, url, timeout=self.timeout, **kwargs)
+                response = self.session.request(method, url, timeout=self.timeout, **kwargs)
                 response.raise_for_status()
                 return response
             except (Timeout, HTTPError) as e:
                 logger.warning(f"Attempt {attempt + 1} of {self.retries} failed for {url}: {e}")
                 if attempt == self.retries - 1:
                     raise
+                time.sleep(self.backoff * 2 ** attempt)
             except RequestException as e:
                 logger.error(f"Request error for {url}: {e}")
                 raise
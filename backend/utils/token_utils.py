@@ -1,34 +1,58 @@
 import tiktoken
 import typing
+import functools
 from backend.core.populate_config import OPENAI_CONFIG
 
+@functools.lru_cache(maxsize=None)
+def get_tokenizer() -> tiktoken.Encoding:
+    """
+    Load the tokenizer for embedding model once per process.
+    :return: tokenizer
+    """
+    return tiktoken.encoding_for_model(OPENAI_CONFIG["EMBEDDING_MODEL"])
+
 def count_tokens(text: str) -> int:
     """
     Calculate the number of tokens in the text for embedding model.
     :param text: input text
     :return: token count
     """
-    tokenizer = tiktoken.encoding_for_model(OPENAI_CONFIG["EMBEDDING_MODEL"])
-    return len(tokenizer.encode(text))
+    return len(get_tokenizer().encode(text))
+
+def count_tokens_batch(texts: typing.List[str]) -> typing.List[int]:
+    """
+    Calculate the number of tokens in each text for embedding model in a single batched encode.
+    :param texts: input texts
+    :return: token counts in the same order as texts
+    """
+    return [len(tokens) for tokens in get_tokenizer().encode_batch(texts)]
 
 def chunk_text(text: str) -> typing.List[str]:
     """
     Split text into chunks that fit within the model's token limit.
+    Chunks end on character boundaries and are shrunk until they re-encode within the limit.
     :param text: input text
     :return: list of text chunks
     """
-    words = text.split()
+    tokenizer = get_tokenizer()
+    tokens = tokenizer.encode(text)
+    max_tokens = OPENAI_CONFIG["MAX_TOKENS"]
+
     chunks = []
-    current_chunk = []
-    current_length = 0
-    for word in words:
-        word_length = count_tokens(word)
-        if current_length + word_length > OPENAI_CONFIG["MAX_TOKENS"]:
-            chunks.append(" ".join(current_chunk))
-            current_chunk = []
-            current_length = 0
-        current_chunk.append(word)
-        current_length += word_length + 1
-    if current_chunk:
-        chunks.append(" ".join(current_chunk))
-    return chunks
\ No newline at end of file
+    start = 0
+    while start < len(tokens):
+        end = min(start + max_tokens, len(tokens))
+        while True:
+            while start + 1 < end < len(tokens) and _starts_mid_character(tokenizer, tokens[end]):
+                end -= 1
+            chunk = tokenizer.decode(tokens[start:end])
+            if end - start <= 1 or len(tokenizer.encode(chunk)) <= max_tokens:
+                break
+            end -= 1
+        chunks.append(chunk)
+        start = end
+    return chunks
+
+def _starts_mid_character(tokenizer: tiktoken.Encoding, token: int) -> bool:
+    """Helper function to check if a token's bytes begin with a UTF-8 continuation byte."""
+    return tokenizer.decode_single_token_bytes(token)[0] & 0xC0 == 0x80
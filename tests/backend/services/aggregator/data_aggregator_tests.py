@@ -2,6 +2,7 @@ import unittest
 import pandas as pd
 from unittest.mock import MagicMock, patch
 from datetime import date, timedelta
+from backend.core.populate_config import AGGREGATOR_CONFIG
 from backend.services.aggregator.data_aggregator import DataAggregator
 from backend.services.embedding.embedding_service import EmbeddingService
 from backend.services.nih.nih_reporter_service import NIHReporterService
@@ -30,36 +31,185 @@ class TestDataAggregator(unittest.TestCase):
         }
 
         self.scraper_service.get_school_faculty_data.return_value = mock_faculty_data
-        self.nih_service.compile_project_metadata.return_value = pd.DataFrame([
-            {
-                "project_number": "TEST",
-                "abstract_text": "TEST",
-                "terms": "TERMS",
-                "start_date": date(2020, 1, 1),
-                "end_date": date(2020, 2, 2),
-                "agency_ic_admin": "TEST",
-                "activity_code": "TEST"
-            }
-        ])
-        self.embedding_service.generate_and_store_embedding.return_value = 1
-        faculty_list = self.aggregator.aggregate_school_faculty_data("SEAS")
+        self.nih_service.compile_project_metadata_bulk.return_value = {
+            ("John", "Doe"): pd.DataFrame([
+                {
+                    "project_number": "TEST",
+                    "abstract_text": "TEST",
+                    "terms": "TERMS",
+                    "start_date": date(2020, 1, 1),
+                    "end_date": date(2020, 2, 2),
+                    "agency_ic_admin": "TEST",
+                    "activity_code": "TEST"
+                }
+            ])
+        }
+        self.embedding_service.store_embeddings.return_value = [1]
+        faculty_list = list(self.aggregator.aggregate_school_faculty_data("SEAS"))
 
         self.assertEqual(len(faculty_list), 1)
         self.assertEqual(faculty_list[0].name, "John Doe")
         self.assertEqual(faculty_list[0].embedding_id, 1)
+        self.assertEqual(len(faculty_list[0].projects), 1)
+        self.nih_service.compile_project_metadata_bulk.assert_called_once_with([("John", "Doe")])
+
+    def test_aggregate_school_faculty_data_merges_departments(self):
+        profile = {
+            "Faculty_Name": "John Doe",
+            "School": "SEAS",
+            "Email_Address": "johndoe@virginia.edu",
+            "About_Section": "About John",
+            "Profile_URL": "https://profile.com"
+        }
+        mock_faculty_data = {
+            "Biomedical Engineering": pd.DataFrame([{**profile, "Department": "Biomedical Engineering"}]),
+            "Chemical Engineering": pd.DataFrame([{**profile, "Department": "Chemical Engineering"}]),
+        }
+
+        self.scraper_service.get_school_faculty_data.return_value = mock_faculty_data
+        self.nih_service.compile_project_metadata_bulk.return_value = {("John", "Doe"): pd.DataFrame()}
+        self.embedding_service.store_embeddings.return_value = [1]
+        faculty_list = list(self.aggregator.aggregate_school_faculty_data("SEAS"))
+
+        self.assertEqual(len(faculty_list), 1)
+        self.assertEqual(faculty_list[0].department, "Biomedical Engineering,Chemical Engineering")
+        self.embedding_service.store_embeddings.assert_called_once()
+
+    @patch.dict(AGGREGATOR_CONFIG, {"STREAM_BATCH_SIZE": 1})
+    def test_aggregate_school_faculty_data_streams_batches(self):
+        mock_faculty_data = {
+            "CS": pd.DataFrame([
+                {
+                    "Faculty_Name": name,
+                    "School": "SEAS",
+                    "Email_Address": "",
+                    "Department": "CS",
+                    "About_Section": "About",
+                    "Profile_URL": "https://profile.com"
+                }
+                for name in ["John Doe", "Jane Roe"]
+            ])
+        }
+
+        self.scraper_service.get_school_faculty_data.return_value = mock_faculty_data
+        self.nih_service.compile_project_metadata_bulk.return_value = {
+            ("John", "Doe"): pd.DataFrame(),
+            ("Jane", "Roe"): pd.DataFrame(),
+        }
+        self.embedding_service.store_embeddings.side_effect = [[0], [1]]
+
+        faculty_iterator = self.aggregator.aggregate_school_faculty_data("SEAS")
+        first_faculty = next(faculty_iterator)
+
+        self.assertEqual(first_faculty.name, "John Doe")
+        self.assertEqual(self.embedding_service.store_embeddings.call_count, 1)
+        self.nih_service.compile_project_metadata_bulk.assert_called_once_with([("John", "Doe"), ("Jane", "Roe")])
+
+        remaining_faculty = list(faculty_iterator)
+        self.assertEqual([faculty.embedding_id for faculty in remaining_faculty], [1])
+        self.assertEqual(self.embedding_service.store_embeddings.call_count, 2)
+
+    @patch.dict(AGGREGATOR_CONFIG, {"STREAM_BATCH_SIZE": 1, "NIH_BATCH_SIZE": 1, "MAX_CONCURRENT_REQUESTS": 1})
+    def test_aggregate_school_faculty_data_prefetches_bounded_window(self):
+        names = ["John Doe", "Jane Roe", "Max Poe", "Ann Loe"]
+        mock_faculty_data = {
+            "CS": pd.DataFrame([
+                {
+                    "Faculty_Name": name,
+                    "School": "SEAS",
+                    "Email_Address": "",
+                    "Department": "CS",
+                    "About_Section": "About",
+                    "Profile_URL": "https://profile.com"
+                }
+                for name in names
+            ])
+        }
+
+        self.scraper_service.get_school_faculty_data.return_value = mock_faculty_data
+        self.nih_service.compile_project_metadata_bulk.side_effect = lambda pi_names: {pi_name: pd.DataFrame() for pi_name in pi_names}
+        self.embedding_service.store_embeddings.side_effect = [[0], [1], [2], [3]]
+
+        faculty_iterator = self.aggregator.aggregate_school_faculty_data("SEAS")
+        next(faculty_iterator)
+
+        self.assertLessEqual(self.nih_service.compile_project_metadata_bulk.call_count, 2)
+
+        remaining_faculty = list(faculty_iterator)
+        self.assertEqual([faculty.name for faculty in remaining_faculty], names[1:])
+        self.assertEqual(self.nih_service.compile_project_metadata_bulk.call_count, len(names))
+
+    @patch.dict(AGGREGATOR_CONFIG, {"STREAM_BATCH_SIZE": 1})
+    def test_aggregate_school_faculty_data_deduplicates_pi_names(self):
+        mock_faculty_data = {
+            dept: pd.DataFrame([
+                {
+                    "Faculty_Name": "John Doe",
+                    "School": "SEAS",
+                    "Email_Address": email,
+                    "Department": dept,
+                    "About_Section": "About John",
+                    "Profile_URL": "https://profile.com"
+                }
+            ])
+            for dept, email in [("CS", "johndoe@virginia.edu"), ("ECE", "jd@virginia.edu")]
+        }
+
+        self.scraper_service.get_school_faculty_data.return_value = mock_faculty_data
+        self.nih_service.compile_project_metadata_bulk.return_value = {
+            ("John", "Doe"): pd.DataFrame([
+                {
+                    "project_number": "TEST",
+                    "abstract_text": "TEST",
+                    "terms": "TERMS",
+                    "start_date": date(2020, 1, 1),
+                    "end_date": date(2020, 2, 2),
+                    "agency_ic_admin": "TEST",
+                    "activity_code": "TEST"
+                }
+            ])
+        }
+        self.embedding_service.store_embeddings.side_effect = [[0], [1]]
+
+        faculty_list = list(self.aggregator.aggregate_school_faculty_data("SEAS"))
+
+        self.assertEqual(len(faculty_list), 2)
+        self.nih_service.compile_project_metadata_bulk.assert_called_once_with([("John", "Doe")])
+        self.assertIsNot(faculty_list[0].projects[0], faculty_list[1].projects[0])
+
+    def test_aggregate_school_faculty_data_skips_empty_profiles(self):
+        mock_faculty_data = {
+            "CS": pd.DataFrame([
+                {
+                    "Faculty_Name": "John Doe",
+                    "School": "SEAS",
+                    "Email_Address": "johndoe@virginia.edu",
+                    "Department": "CS",
+                    "About_Section": "  ",
+                    "Profile_URL": "https://profile.com"
+                }
+            ])
+        }
+
+        self.scraper_service.get_school_faculty_data.return_value = mock_faculty_data
+        self.nih_service.compile_project_metadata_bulk.return_value = {("John", "Doe"): pd.DataFrame()}
+        faculty_list = list(self.aggregator.aggregate_school_faculty_data("SEAS"))
+
+        self.assertEqual(faculty_list[0].embedding_id, -1)
+        self.embedding_service.generate_embeddings.assert_not_called()
+        self.embedding_service.store_embeddings.assert_not_called()
 
     def test_build_faculty_model(self):
-        mock_profile = MagicMock(
-            Faculty_Name="John Doe",
-            School="NONE",
-            Department="CS",
-            Email_Address="johndoe@testing.edu",
-            About_Section="About John",
-            Profile_URL="https://profile.com"
-        )
+        mock_profile = {
+            "name": "John Doe",
+            "school": "NONE",
+            "department": "CS",
+            "email": "johndoe@testing.edu",
+            "about": "About John",
+            "profile_url": "https://profile.com"
+        }
 
-        with patch.object(self.aggregator, "_get_projects", return_value=[]):
-            faculty = self.aggregator._build_faculty_model(mock_profile)
+        faculty = self.aggregator._build_faculty_model(mock_profile, pd.DataFrame())
 
         self.assertEqual(faculty.name, "John Doe")
         self.assertEqual(faculty.school, "NONE")
@@ -82,8 +232,7 @@ class TestDataAggregator(unittest.TestCase):
             }
         ])
 
-        self.nih_service.compile_project_metadata.return_value = mock_project_df
-        projects = self.aggregator._get_projects("John", "Doe")
+        projects = self.aggregator._convert_to_project_models(mock_project_df)
 
         self.assertEqual(len(projects), 1)
         self.assertEqual(projects[0].project_number, "TEST1")
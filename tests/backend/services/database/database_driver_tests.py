@@ -28,6 +28,13 @@ class TestDatabaseDriver(unittest.TestCase):
             self.db_driver.add_faculty(faculty)
             mock_add_faculty.assert_called_once_with(faculty)
 
+    def test_add_faculty_batch(self):
+        faculty = [MagicMock(spec=Faculty), MagicMock(spec=Faculty)]
+
+        with patch.object(self.db_driver, "_add_faculty_batch") as mock_add_faculty_batch:
+            self.db_driver.add_faculty_batch(faculty)
+            mock_add_faculty_batch.assert_called_once_with(faculty)
+
     def test_get_faculty_by_embedding_id(self):
         faculty = MagicMock(spec=Faculty)
         faculty.name = "John Doe"
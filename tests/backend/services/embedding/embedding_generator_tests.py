@@ -2,7 +2,7 @@ import unittest
 from unittest.mock import MagicMock, patch, call
 from backend.services.embedding.embedding_generator import EmbeddingGenerator
 from backend.core.populate_config import OPENAI_CONFIG
-from backend.utils.token_utils import count_tokens, chunk_text
+from backend.utils.token_utils import count_tokens, chunk_text, get_tokenizer
 
 class TestEmbeddingGenerator(unittest.TestCase):
     MODULE_PATH = "backend.services.embedding.embedding_generator"
@@ -40,6 +40,48 @@ class TestEmbeddingGenerator(unittest.TestCase):
                 places=2
             )
 
+    @patch.dict(OPENAI_CONFIG, {"EMBEDDING_BATCH_SIZE": 2})
+    @patch(f"{MODULE_PATH}.count_tokens_batch")
+    @patch(f"{MODULE_PATH}.EmbeddingGenerator._call_batch_embedding_api")
+    def test_generate_embeddings_batches_inputs(self, mock_call_batch_api, mock_count_tokens_batch):
+        mock_count_tokens_batch.return_value = [10, 10, 10]
+        mock_call_batch_api.side_effect = [[[0.1], [0.2]], [[0.3]]]
+
+        result = self.generator.generate_embeddings(["text1", "text2", "text3"])
+
+        mock_call_batch_api.assert_has_calls([call(["text1", "text2"]), call(["text3"])])
+        self.assertEqual(result, [[0.1], [0.2], [0.3]])
+
+    @patch(f"{MODULE_PATH}.count_tokens_batch")
+    @patch(f"{MODULE_PATH}.EmbeddingGenerator._generate_chunked_embedding")
+    @patch(f"{MODULE_PATH}.EmbeddingGenerator._call_batch_embedding_api")
+    def test_generate_embeddings_chunks_long_texts(self, mock_call_batch_api, mock_chunked_embedding, mock_count_tokens_batch):
+        mock_count_tokens_batch.return_value = [10, OPENAI_CONFIG["MAX_TOKENS"] + 10, 10]
+        mock_chunked_embedding.return_value = [0.2]
+        mock_call_batch_api.return_value = [[0.1], [0.3]]
+
+        result = self.generator.generate_embeddings(["text1", "long text", "text3"])
+
+        mock_chunked_embedding.assert_called_once_with("long text")
+        mock_call_batch_api.assert_called_once_with(["text1", "text3"])
+        self.assertEqual(result, [[0.1], [0.2], [0.3]])
+
+    def test_chunk_text_chunks_fit_token_limit(self):
+        try:
+            get_tokenizer()
+        except Exception as e:
+            self.skipTest(f"tiktoken encoding for {OPENAI_CONFIG['EMBEDDING_MODEL']} unavailable: {e}")
+
+        text = "naïve café 東京大学 résumé 🧬 " * 3000
+
+        chunks = chunk_text(text)
+
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(count_tokens(chunk), OPENAI_CONFIG["MAX_TOKENS"])
+            self.assertNotIn("\ufffd", chunk)
+        self.assertEqual("".join(chunks), text)
+
     def test_aggregate_embeddings(self):
         embeddings = [
             [1, 2, 3],
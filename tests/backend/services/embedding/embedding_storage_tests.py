@@ -0,0 +1,141 @@
+import os
+import faiss
+import unittest
+import tempfile
+import numpy as np
+from unittest.mock import MagicMock, patch
+from backend.core.populate_config import OPENAI_CONFIG, FAISS_CONFIG
+from backend.services.database.database_driver import DatabaseDriver
+from backend.services.embedding.embedding_storage import EmbeddingStorage
+
+class TestEmbeddingStorage(unittest.TestCase):
+    MODULE_PATH = "backend.services.embedding.embedding_storage"
+    DIMENSIONS = 16
+    TRAINING_THRESHOLD = 64
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.index_path = os.path.join(self.temp_dir.name, "faiss_index.bin")
+
+        patchers = [
+            patch(f"{self.MODULE_PATH}.INDEX_PATH", self.index_path),
+            patch.dict(OPENAI_CONFIG, {"EMBEDDING_DIMENSIONS": self.DIMENSIONS}),
+            patch.dict(FAISS_CONFIG, {
+                "IVF_PQ_INDEX": "IVF8,PQ8x4",
+                "IVF_PQ_MIN_TRAINING_VECTORS": self.TRAINING_THRESHOLD * 4,
+                "SMALL_IVF_PQ_INDEX": "IVF4,PQ8x4",
+                "SMALL_IVF_PQ_MIN_TRAINING_VECTORS": self.TRAINING_THRESHOLD,
+                "NPROBE": 4,
+            }),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.database_driver = MagicMock(spec=DatabaseDriver)
+        self.storage = EmbeddingStorage(self.database_driver)
+        self.rng = np.random.default_rng(0)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _random_vectors(self, count: int) -> np.ndarray:
+        return self.rng.standard_normal((count, self.DIMENSIONS)).astype(np.float32)
+
+    def test_add_embeddings_trains_ivf_pq_index(self):
+        embedding_ids = self.storage.add_embeddings(self._random_vectors(self.TRAINING_THRESHOLD))
+
+        ivf_index = faiss.try_extract_index_ivf(self.storage.index)
+        self.assertIsNotNone(ivf_index)
+        self.assertTrue(self.storage.index.is_trained)
+        self.assertEqual(ivf_index.nlist, 4)
+        self.assertEqual(ivf_index.nprobe, FAISS_CONFIG["NPROBE"])
+        self.assertEqual(embedding_ids, list(range(self.TRAINING_THRESHOLD)))
+
+    def test_reconstruct_batch_after_reload(self):
+        self.storage.add_embeddings(self._random_vectors(self.TRAINING_THRESHOLD))
+
+        reloaded_storage = EmbeddingStorage(self.database_driver)
+        reloaded_storage._load_index()
+
+        self.assertIsNotNone(faiss.try_extract_index_ivf(reloaded_storage.index))
+        self.assertEqual(faiss.try_extract_index_ivf(reloaded_storage.index).nprobe, FAISS_CONFIG["NPROBE"])
+        self.assertEqual(reloaded_storage.index.reconstruct_batch([0, 5]).shape, (2, self.DIMENSIONS))
+
+    def test_add_embeddings_below_threshold_uses_fp16_index(self):
+        embedding_ids = self.storage.add_embeddings(self._random_vectors(self.TRAINING_THRESHOLD - 1))
+
+        self.assertIsInstance(self.storage.index, faiss.IndexScalarQuantizer)
+        self.assertIsNone(faiss.try_extract_index_ivf(self.storage.index))
+        self.assertEqual(embedding_ids, list(range(self.TRAINING_THRESHOLD - 1)))
+
+    def test_add_embeddings_rebuilds_index_when_crossing_threshold(self):
+        first_vectors = self._random_vectors(self.TRAINING_THRESHOLD // 2)
+        self.storage.add_embeddings(first_vectors)
+        self.assertIsInstance(self.storage.index, faiss.IndexScalarQuantizer)
+
+        embedding_ids = self.storage.add_embeddings(self._random_vectors(self.TRAINING_THRESHOLD))
+
+        self.assertIsNotNone(faiss.try_extract_index_ivf(self.storage.index))
+        self.assertEqual(self.storage.index.ntotal, len(first_vectors) + self.TRAINING_THRESHOLD)
+        self.assertEqual(embedding_ids, list(range(len(first_vectors), self.storage.index.ntotal)))
+        self.assertEqual(self.storage.search_similar_embeddings(first_vectors[0].tolist(), top_k=1), [0])
+
+    def test_add_embedding_rebuilds_index_when_crossing_threshold(self):
+        self.storage.add_embeddings(self._random_vectors(self.TRAINING_THRESHOLD - 1))
+
+        embedding_id = self.storage.add_embedding("John Doe", self._random_vectors(1)[0].tolist())
+
+        self.assertEqual(embedding_id, self.TRAINING_THRESHOLD - 1)
+        self.assertIsNotNone(faiss.try_extract_index_ivf(self.storage.index))
+
+    def test_search_ranks_by_cosine_similarity(self):
+        vectors = np.zeros((3, self.DIMENSIONS), dtype=np.float32)
+        vectors[0, 0] = 1.0
+        vectors[1, :2] = 10.0
+        vectors[2, 1] = 1.0
+        self.storage.add_embeddings(vectors)
+
+        query = np.zeros(self.DIMENSIONS, dtype=np.float32)
+        query[:2] = [1.0, 0.1]
+
+        self.assertIsInstance(self.storage.index, faiss.IndexScalarQuantizer)
+        self.assertEqual(self.storage.index.metric_type, faiss.METRIC_INNER_PRODUCT)
+        self.assertEqual(self.storage.search_similar_embeddings(query.tolist(), top_k=3), [0, 1, 2])
+
+    def test_search_with_parameters_matches_unfiltered_order(self):
+        vectors = self._random_vectors(20)
+        self.storage.add_embeddings(vectors)
+        self.database_driver.get_embedding_ids_by_search_parameters.return_value = list(range(20))
+        query = self._random_vectors(1)[0].tolist()
+
+        unfiltered_results = self.storage.search_similar_embeddings(query, top_k=5)
+        filtered_results = self.storage.search_similar_embeddings(query, top_k=5, school="SEAS")
+
+        self.assertEqual(filtered_results, unfiltered_results)
+
+    def test_search_full_index_drops_faiss_padding(self):
+        self.storage.add_embeddings(self._random_vectors(3))
+
+        results = self.storage.search_similar_embeddings(self._random_vectors(1)[0].tolist(), top_k=10)
+
+        self.assertEqual(sorted(results), [0, 1, 2])
+
+    def test_search_with_parameters_drops_unembedded_faculty(self):
+        self.storage.add_embeddings(self._random_vectors(3))
+        self.database_driver.get_embedding_ids_by_search_parameters.return_value = [-1, 0, -1, 2, 99]
+
+        results = self.storage.search_similar_embeddings(self._random_vectors(1)[0].tolist(), top_k=10, school="SEAS")
+
+        self.assertEqual(sorted(results), [0, 2])
+
+    def test_search_with_parameters_only_unembedded_faculty(self):
+        self.storage.add_embeddings(self._random_vectors(3))
+        self.database_driver.get_embedding_ids_by_search_parameters.return_value = [-1, -1]
+
+        results = self.storage.search_similar_embeddings(self._random_vectors(1)[0].tolist(), top_k=10, school="SEAS")
+
+        self.assertEqual(results, [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+from backend.utils.http_client import HttpClient
+from backend.services.nih.nih_reporter_proxy import NIHReporterProxy
+
+class TestNIHReporterProxy(unittest.TestCase):
+    def setUp(self):
+        self.http_client = MagicMock(spec=HttpClient)
+        self.http_client.post.return_value = MagicMock(content=b'{"results": []}')
+
+    def test_call_reporter_api(self):
+        proxy = NIHReporterProxy(self.http_client, min_request_interval=0)
+
+        response = proxy.call_reporter_api({"criteria": {"fiscal_years": [2024]}})
+
+        self.assertEqual(response, {"results": []})
+        self.assertEqual(self.http_client.post.call_args.kwargs["data"], b'{"criteria":{"fiscal_years":[2024]}}')
+
+    def test_call_reporter_api_rate_limited_across_threads(self):
+        proxy = NIHReporterProxy(self.http_client, min_request_interval=0.05)
+        request_times = []
+        self.http_client.post.side_effect = lambda *args, **kwargs: (
+            request_times.append(time.monotonic()) or MagicMock(content=b'{"results": []}')
+        )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(proxy.call_reporter_api, [{}] * 4))
+
+        request_times.sort()
+        for previous_time, next_time in zip(request_times, request_times[1:]):
+            self.assertGreaterEqual(next_time - previous_time, 0.045)
+
+if __name__ == '__main__':
+    unittest.main()
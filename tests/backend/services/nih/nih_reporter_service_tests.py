@@ -0,0 +1,148 @@
+import os
+import sqlite3
+import unittest
+import tempfile
+from unittest.mock import MagicMock, patch
+from backend.core.populate_config import NIH_REPORTER_PAYLOAD
+from backend.services.nih.nih_reporter_cache import NIHReporterCache
+from backend.services.nih.nih_reporter_proxy import NIHReporterProxy
+from backend.services.nih.nih_reporter_service import NIHReporterService
+
+class TestNIHReporterService(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = NIHReporterCache(os.path.join(self.temp_dir.name, "nih_cache.sqlite"))
+        self.proxy = MagicMock(spec=NIHReporterProxy)
+        self.service = NIHReporterService(self.proxy, self.cache)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_invoke_proxy_caches_response(self):
+        self.proxy.call_reporter_api.return_value = {"results": [{"project_num": "TEST"}]}
+
+        first_response = self.service.invoke_proxy("John", "Doe", [2024])
+        second_response = self.service.invoke_proxy("JOHN", "DOE", [2024])
+
+        self.proxy.call_reporter_api.assert_called_once()
+        self.assertEqual(first_response, second_response)
+
+    def test_invoke_proxy_reads_persisted_cache(self):
+        self.proxy.call_reporter_api.return_value = {"results": []}
+        self.service.invoke_proxy("John", "Doe", [2024])
+
+        service = NIHReporterService(self.proxy, NIHReporterCache(self.cache.cache_path))
+        self.assertEqual(service.invoke_proxy("John", "Doe", [2024]), {"results": []})
+        self.proxy.call_reporter_api.assert_called_once()
+
+    def test_cache_stores_responses_as_text(self):
+        self.cache.set(NIHReporterCache.make_key("John", "Doe", [2024]), {"results": []})
+
+        with sqlite3.connect(self.cache.cache_path) as connection:
+            self.assertEqual(connection.execute("SELECT typeof(response) FROM nih_cache").fetchall(), [("text",)])
+
+    def test_invoke_proxy_ignores_expired_cache(self):
+        self.proxy.call_reporter_api.return_value = {"results": []}
+        self.service.invoke_proxy("John", "Doe", [2024])
+
+        service = NIHReporterService(self.proxy, NIHReporterCache(self.cache.cache_path, ttl_seconds=-1))
+        service.invoke_proxy("John", "Doe", [2024])
+        self.assertEqual(self.proxy.call_reporter_api.call_count, 2)
+
+    def test_invoke_proxy_treats_unreadable_cache_as_miss(self):
+        self.proxy.call_reporter_api.return_value = {"results": []}
+        with open(self.cache.cache_path, "wb") as cache_file:
+            cache_file.write(b"not a sqlite database")
+
+        self.assertEqual(self.service.invoke_proxy("John", "Doe", [2024]), {"results": []})
+        self.proxy.call_reporter_api.assert_called_once()
+
+    def test_cache_memory_layer_is_bounded(self):
+        cache = NIHReporterCache(self.cache.cache_path, memory_cache_size=1)
+        first_key = NIHReporterCache.make_key("John", "Doe", [2024])
+        second_key = NIHReporterCache.make_key("Jane", "Roe", [2024])
+
+        cache.set(first_key, {"results": [1]})
+        cache.set(second_key, {"results": [2]})
+
+        self.assertEqual(list(cache._memory_cache), [second_key])
+        self.assertEqual(cache.get(first_key), {"results": [1]})
+        self.assertEqual(list(cache._memory_cache), [first_key])
+
+    def test_invoke_proxy_bulk_splits_projects_by_pi(self):
+        self.proxy.call_reporter_api.return_value = {
+            "meta": {"total": 2},
+            "results": [
+                {"project_num": "TEST1", "principal_investigators": [{"first_name": "JOHN", "last_name": "DOE"}]},
+                {"project_num": "TEST2", "principal_investigators": [
+                    {"first_name": "Jane", "last_name": "Roe"},
+                    {"first_name": "John", "last_name": "Doe"},
+                ]},
+            ],
+        }
+
+        responses = self.service.invoke_proxy_bulk([("John", "Doe"), ("Jane", "Roe"), ("Max", "Poe")], [2024])
+
+        self.proxy.call_reporter_api.assert_called_once()
+        self.assertEqual([p["project_num"] for p in responses[("John", "Doe")]["results"]], ["TEST1", "TEST2"])
+        self.assertEqual([p["project_num"] for p in responses[("Jane", "Roe")]["results"]], ["TEST2"])
+        self.assertEqual(responses[("Max", "Poe")]["results"], [])
+
+    def test_split_projects_by_pi_logs_unassigned_projects(self):
+        projects = [
+            {"project_num": "TEST1", "principal_investigators": [{"first_name": "John", "last_name": "Doe"}]},
+            {"project_num": "TEST2", "principal_investigators": [{"first_name": "Johnathan", "last_name": "Doe"}]},
+        ]
+
+        with self.assertLogs("backend.services.nih.nih_reporter_service", level="WARNING") as logs:
+            pi_projects = NIHReporterService.split_projects_by_pi([("John", "Doe")], projects)
+
+        self.assertEqual([p["project_num"] for p in pi_projects[("John", "Doe")]], ["TEST1"])
+        self.assertIn("1 of 2 NIH RePORTER projects", logs.output[0])
+
+    def test_invoke_proxy_bulk_paginates(self):
+        project = {"project_num": "TEST", "principal_investigators": [{"first_name": "John", "last_name": "Doe"}]}
+        self.proxy.call_reporter_api.side_effect = [
+            {"meta": {"total": 3}, "results": [project, project]},
+            {"meta": {"total": 3}, "results": [project]},
+        ]
+
+        with patch.object(NIHReporterService, "PAGE_LIMIT", 2):
+            responses = self.service.invoke_proxy_bulk([("John", "Doe")], [2024])
+
+        self.assertEqual(self.proxy.call_reporter_api.call_count, 2)
+        self.assertEqual(len(responses[("John", "Doe")]["results"]), 3)
+
+    def test_invoke_proxy_bulk_skips_cached_pis(self):
+        self.proxy.call_reporter_api.return_value = {"meta": {"total": 0}, "results": []}
+        self.service.invoke_proxy_bulk([("John", "Doe")], [2024])
+
+        self.service.invoke_proxy_bulk([("John", "Doe"), ("Jane", "Roe")], [2024])
+
+        payload = self.proxy.call_reporter_api.call_args.args[0]
+        self.assertEqual(payload["criteria"]["pi_names"], [{"first_name": "Jane", "last_name": "Roe"}])
+
+    def test_invoke_proxy_bulk_ignores_single_pi_cache_entries(self):
+        unmatched_project = {"project_num": "TEST", "principal_investigators": [{"first_name": "Johnathan", "last_name": "Doe"}]}
+        self.proxy.call_reporter_api.return_value = {"meta": {"total": 1}, "results": [unmatched_project]}
+        self.service.invoke_proxy("John", "Doe", [2024])
+
+        responses = self.service.invoke_proxy_bulk([("John", "Doe")], [2024])
+
+        self.assertEqual(self.proxy.call_reporter_api.call_count, 2)
+        self.assertEqual(responses[("John", "Doe")]["results"], [])
+        self.assertEqual(self.service.invoke_proxy("John", "Doe", [2024])["results"], [unmatched_project])
+
+    def test_build_payload(self):
+        payload = self.service.build_payload("John", "Doe", (2023, 2024))
+
+        self.assertEqual(payload["criteria"]["pi_names"], [{"first_name": "John", "last_name": "Doe"}])
+        self.assertEqual(payload["criteria"]["fiscal_years"], [2023, 2024])
+        self.assertEqual(NIH_REPORTER_PAYLOAD["criteria"]["pi_names"], ())
+
+    def test_invoke_proxy_without_names(self):
+        with self.assertRaises(ValueError):
+            self.service.invoke_proxy(None, "Doe", [2024])
+
+if __name__ == '__main__':
+    unittest.main()